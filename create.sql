@@ -1,7 +1,7 @@
 DROP TABLE IF EXISTS recipes;
 
 CREATE TABLE IF NOT EXISTS recipes (
-  id integer PRIMARY KEY AUTO_INCREMENT,
+  id integer UNSIGNED NOT NULL PRIMARY KEY AUTO_INCREMENT,
   -- name of recipe
   title varchar(100) CHARACTER SET utf8 COLLATE utf8_unicode_ci NOT NULL,
   -- time required to cook/bake the recipe
@@ -11,9 +11,9 @@ CREATE TABLE IF NOT EXISTS recipes (
   -- food items necessary to prepare the recipe
   ingredients varchar(300) CHARACTER SET utf8 COLLATE utf8_unicode_ci NOT NULL,
   -- price of recipe
-  cost integer NOT NULL,
-  created_at datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
-  updated_at datetime on update CURRENT_TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+  cost integer UNSIGNED NOT NULL,
+  created_at timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  updated_at timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
 INSERT INTO recipes (
@@ -35,19 +35,7 @@ VALUES (
   1000,
   '2016-01-10 12:10:12',
   '2016-01-10 12:10:12'
-);
-
-INSERT INTO recipes (
-  id,
-  title,
-  making_time,
-  serves,
-  ingredients,
-  cost,
-  created_at,
-  updated_at
-)
-VALUES (
+), (
   2,
   'オムライス',
   '30分',
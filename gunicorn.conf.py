@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+
+# Gunicorn configuration, picked up automatically from the working directory
+bind = f"0.0.0.0:{os.getenv('PORT', 3000)}"
+
+# One process per core plus spare, each serving several requests at once
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+# With GUNICORN_WORKER_CLASS=gevent, requests are greenlets instead of
+# threads; cap them at the pool size so none waits on an exhausted pool.
+# gthread also reads this as its accept and keep-alive limit, so leave it
+# at gunicorn's default there.
+if worker_class == 'gevent':
+    worker_connections = int(os.getenv('DB_POOL_SIZE', 16))
+
+timeout = 120
+
+# Same switch as the app's logger in main.py
+loglevel = os.getenv('LOG_LEVEL', 'INFO').lower()
+
+
+# Importing main here loads the app in the master, like preload_app: workers
+# fork with it already imported, so a SIGHUP reload restarts them on the
+# same code. Deploy new code with a full restart.
+def on_starting(server):
+    """Create the database and table once, in the master, before any worker boots."""
+    import main
+    try:
+        main.ensure_database_and_table()
+    except Exception:
+        # Keep serving; workers retry when they open their pool
+        server.log.warning("Database unavailable at startup; schema bootstrap deferred")
+
+
+def post_worker_init(worker):
+    """Open each worker's own connection pool after it has forked."""
+    import main
+    if worker.cfg.worker_class_str == 'gevent':
+        main.enable_gevent_wait_callback()
+    # Created here rather than at import in the master, so under gevent it
+    # is a patched lock that yields instead of blocking the whole worker
+    main.create_db_pool_lock()
+    try:
+        main.init_db_pool()
+    except Exception:
+        # A worker that fails to boot makes the master shut the server down,
+        # so during a database outage boot without a pool and let requests
+        # open it lazily through get_db_connection()
+        worker.log.warning("Database unavailable at worker boot; pool will be opened on first use")
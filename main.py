@@ -1,110 +1,320 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request
+from werkzeug.http import generate_etag
+from cachetools import TTLCache
+from typing import Annotated, Optional
+import msgspec
+import orjson
 import psycopg2
-from psycopg2.extras import DictCursor
+from psycopg2.extras import execute_values
 from psycopg2 import pool, sql
+import csv
+import io
 import os
 import logging
+import threading
+import time
 
 # Logging configuration
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper())
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+# '/recipes/' and '/recipes' are the same route, answered without a redirect
+app.url_map.strict_slashes = False
 
-# Database connection pool
+# Database connection pool, opened lazily under db_pool_lock if the
+# worker could not open it at boot. The lock is created per worker by
+# create_db_pool_lock(), after gevent has had a chance to patch threading.
 db_pool = None
+db_pool_lock = None
+# Set once the schema bootstrap has succeeded, so forked workers skip it
+schema_ready = False
 
-def ensure_database_and_table():
-    """Ensure the database and 'recipes' table exist."""
-    try:
-        logger.debug("Ensuring the database and 'recipes' table exist...")
-        # Connect to the default 'postgres' database
-        conn = psycopg2.connect(
-            dbname='postgres',
-            user=os.getenv('DB_USER', 'user'),
-            password=os.getenv('DB_PASSWORD', 'password'),
-            host=os.getenv('DB_HOST', 'localhost'),
-            port=os.getenv('DB_PORT', 5432)
-        )
+# Per-process read caches. Writes handled by this process invalidate them;
+# other workers pick up changes once the TTL expires.
+RECIPE_CACHE_TTL = int(os.getenv('RECIPE_CACHE_TTL', 5))
+# Entries are already-encoded (body, etag) pairs, so hits skip serialization.
+recipe_cache = TTLCache(maxsize=10_000, ttl=RECIPE_CACHE_TTL)  # recipe id -> response
+page_cache = TTLCache(maxsize=1024, ttl=RECIPE_CACHE_TTL)  # (after, limit) -> response
+cache_lock = threading.Lock()
+# Bumped on every invalidation; a read only fills the cache if no write
+# invalidated it since the read started, so a stale row is never stored
+cache_generation = 0
+
+# Schema bootstrap, sent to the server as one multi-statement batch
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS recipes (
+    id SERIAL PRIMARY KEY,
+    title VARCHAR(100) NOT NULL,
+    making_time VARCHAR(100) NOT NULL,
+    serves VARCHAR(100) NOT NULL,
+    ingredients VARCHAR(300) NOT NULL,
+    cost INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+-- Covers GET /recipes/summary so it is answered by an index-only scan
+CREATE INDEX IF NOT EXISTS recipes_summary_idx ON recipes (id) INCLUDE (title, cost, created_at);
+"""
+
+# Columns sent back to clients for a recipe; handlers fetch plain
+# tuples in this order and zip them with the names once per row
+RECIPE_FIELDS = ("id", "title", "making_time", "serves", "ingredients", "cost", "created_at", "updated_at")
+RECIPE_COLUMNS = ", ".join(RECIPE_FIELDS)
+
+# Columns of GET /recipes/summary, all held in recipes_summary_idx
+SUMMARY_FIELDS = ("id", "title", "cost", "created_at")
+SUMMARY_COLUMNS = ", ".join(SUMMARY_FIELDS)
+
+# Rows fetched per round trip when streaming the recipe list
+STREAM_BATCH_SIZE = 1000
+
+# Rows per multi-row INSERT statement in POST /recipes/bulk; batches
+# larger than BULK_COPY_THRESHOLD are streamed in with COPY instead
+BULK_PAGE_SIZE = 1000
+BULK_COPY_THRESHOLD = 10_000
+
+# Rows per UPDATE ... FROM (VALUES ...) statement in PATCH /recipes/bulk
+BULK_UPDATE_PAGE_SIZE = 500
+
+# Largest value of the int4 columns, recipes.id (SERIAL) and recipes.cost
+INT4_MAX = 2**31 - 1
+# Ids above it cannot exist and are answered as not found up front
+MAX_RECIPE_ID = INT4_MAX
+
+# Page size bounds for ?limit=&after= keyset pagination
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Pooled connections idle for longer than this many seconds are pinged
+# before being handed out, in case the server has dropped them meanwhile
+POOL_PING_AFTER = int(os.getenv('DB_POOL_PING_AFTER', 30))
+
+# Hot statements, prepared once per pooled connection and run with EXECUTE
+PREPARE_STATEMENTS = f"""
+PREPARE select_recipe (integer) AS
+    SELECT {RECIPE_COLUMNS} FROM recipes WHERE id = $1;
+PREPARE select_recipes_page (integer, integer) AS
+    SELECT {RECIPE_COLUMNS} FROM recipes WHERE id > $1 ORDER BY id LIMIT $2;
+PREPARE insert_recipe (varchar, varchar, varchar, varchar, integer) AS
+    INSERT INTO recipes (title, making_time, serves, ingredients, cost)
+    VALUES ($1, $2, $3, $4, $5)
+    RETURNING {RECIPE_COLUMNS};
+PREPARE update_recipe (varchar, varchar, varchar, varchar, integer, integer) AS
+    UPDATE recipes SET
+        title = COALESCE($1, title),
+        making_time = COALESCE($2, making_time),
+        serves = COALESCE($3, serves),
+        ingredients = COALESCE($4, ingredients),
+        cost = COALESCE($5, cost),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = $6
+    RETURNING {RECIPE_COLUMNS};
+PREPARE delete_recipe (integer) AS
+    DELETE FROM recipes WHERE id = $1;
+"""
+
+# Request bodies, validated while msgspec decodes the raw JSON; column
+# widths mirror the recipes table so oversize values never reach the DB
+class RecipeIn(msgspec.Struct):
+    """Body of POST /recipes; every field is required and non-empty."""
+    title: Annotated[str, msgspec.Meta(min_length=1, max_length=100)]
+    making_time: Annotated[str, msgspec.Meta(min_length=1, max_length=100)]
+    serves: Annotated[str, msgspec.Meta(min_length=1, max_length=100)]
+    ingredients: Annotated[str, msgspec.Meta(min_length=1, max_length=300)]
+    cost: Annotated[int, msgspec.Meta(gt=0, le=INT4_MAX)]
+
+class RecipePatch(msgspec.Struct):
+    """Body of PATCH /recipes/<id>; omitted fields are left unchanged."""
+    title: Optional[Annotated[str, msgspec.Meta(min_length=1, max_length=100)]] = None
+    making_time: Optional[Annotated[str, msgspec.Meta(min_length=1, max_length=100)]] = None
+    serves: Optional[Annotated[str, msgspec.Meta(min_length=1, max_length=100)]] = None
+    ingredients: Optional[Annotated[str, msgspec.Meta(min_length=1, max_length=300)]] = None
+    cost: Optional[Annotated[int, msgspec.Meta(gt=0, le=INT4_MAX)]] = None
+
+class RecipeBulkPatch(RecipePatch, kw_only=True):
+    """One entry of PATCH /recipes/bulk: a recipe id plus the fields to change."""
+    id: int
+
+# Bodies of POST and PATCH /recipes/bulk
+RecipeBatch = Annotated[list[RecipeIn], msgspec.Meta(min_length=1)]
+RecipePatchBatch = Annotated[list[RecipeBulkPatch], msgspec.Meta(min_length=1)]
+
+# Decoders are built once, so each request goes straight to msgspec's C
+# parser; strict=False lets numeric strings such as "1000" through for cost
+recipe_decoder = msgspec.json.Decoder(RecipeIn, strict=False)
+recipe_patch_decoder = msgspec.json.Decoder(RecipePatch, strict=False)
+recipe_batch_decoder = msgspec.json.Decoder(RecipeBatch, strict=False)
+recipe_patch_batch_decoder = msgspec.json.Decoder(RecipePatchBatch, strict=False)
+
+class PreparedConnectionPool(psycopg2.pool.ThreadedConnectionPool):
+    """Thread-safe pool that sets up each new connection once and checks stale ones on checkout."""
+
+    def __init__(self, *args, **kwargs):
+        # id(conn) -> time it was opened or last returned; set before
+        # super() opens the first minconn connections
+        self._last_used = {}
+        super().__init__(*args, **kwargs)
+
+    def _connect(self, key=None):
+        conn = super()._connect(key)
+        # Single statements commit on their own, with no BEGIN/COMMIT round trips
         conn.autocommit = True
         cursor = conn.cursor()
+        cursor.execute(PREPARE_STATEMENTS)
+        cursor.close()
+        self._last_used[id(conn)] = time.monotonic()
+        return conn
 
-        # Check if the database exists
-        db_name = os.getenv('DB_NAME', 'database')
-        cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (db_name,))
-        if not cursor.fetchone():
-            # Create the database if it does not exist
-            logger.info(f"Database '{db_name}' does not exist. Creating...")
-            cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(db_name)))
-            logger.info(f"Database '{db_name}' created successfully.")
-        
+    def getconn(self, key=None):
+        while True:
+            conn = super().getconn(key)
+            last_used = self._last_used.pop(id(conn), None)
+            if last_used is None or time.monotonic() - last_used < POOL_PING_AFTER:
+                return conn
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT 1")
+                cursor.close()
+                return conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                # Dropped by the server while idle; discard it and take another
+                logger.warning("Discarding stale pooled connection: %s", e)
+                super().putconn(conn, key, close=True)
+
+    def putconn(self, conn=None, key=None, close=False):
+        if not close:
+            self._last_used[id(conn)] = time.monotonic()
+        super().putconn(conn, key, close)
+        if conn.closed:
+            self._last_used.pop(id(conn), None)
+
+def connect_to(dbname):
+    """Open a standalone autocommit connection to the given database."""
+    conn = psycopg2.connect(
+        dbname=dbname,
+        user=os.getenv('DB_USER', 'user'),
+        password=os.getenv('DB_PASSWORD', 'password'),
+        host=os.getenv('DB_HOST', 'localhost'),
+        port=os.getenv('DB_PORT', 5432)
+    )
+    conn.autocommit = True
+    return conn
+
+def create_database(db_name):
+    """Create the application database through the default 'postgres' database."""
+    conn = connect_to('postgres')
+    cursor = conn.cursor()
+
+    # Check if the database exists
+    cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (db_name,))
+    if cursor.fetchone():
         cursor.close()
         conn.close()
+        return False
 
-        # Connect to the application database to ensure the table exists
-        conn = psycopg2.connect(
-            dbname=db_name,
-            user=os.getenv('DB_USER', 'user'),
-            password=os.getenv('DB_PASSWORD', 'password'),
-            host=os.getenv('DB_HOST', 'localhost'),
-            port=os.getenv('DB_PORT', 5432)
-        )
+    logger.info("Database '%s' does not exist. Creating...", db_name)
+    cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(db_name)))
+    logger.info("Database '%s' created successfully.", db_name)
+    cursor.close()
+    conn.close()
+    return True
+
+def ensure_database_and_table():
+    """Ensure the database and 'recipes' table exist."""
+    global schema_ready
+    try:
+        logger.debug("Ensuring the database and 'recipes' table exist...")
+        db_name = os.getenv('DB_NAME', 'database')
+        # The database is nearly always there already, so go straight to it
+        # and only detour through 'postgres' when the connection is refused
+        try:
+            conn = connect_to(db_name)
+        except psycopg2.OperationalError:
+            if not create_database(db_name):
+                raise
+            conn = connect_to(db_name)
         cursor = conn.cursor()
 
-        # Create 'recipes' table if it doesn't exist
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS recipes (
-            id SERIAL PRIMARY KEY,
-            title VARCHAR(100) NOT NULL,
-            making_time VARCHAR(100) NOT NULL,
-            serves VARCHAR(100) NOT NULL,
-            ingredients VARCHAR(300) NOT NULL,
-            cost INTEGER NOT NULL,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        conn.commit()
+        # Create the schema in a single round trip
+        cursor.execute(SCHEMA_SQL)
         logger.info("'recipes' table ensured in the database.")
         cursor.close()
         conn.close()
+        schema_ready = True
     except Exception as e:
-        logger.error(f"Error ensuring database and table: {e}")
+        logger.error("Error ensuring database and table: %s", e)
         raise
 
+def enable_gevent_wait_callback():
+    """Make psycopg2 yield to other greenlets while it waits on the server."""
+    from gevent.socket import wait_read, wait_write
+
+    def wait_callback(conn, timeout=None):
+        while True:
+            state = conn.poll()
+            if state == psycopg2.extensions.POLL_OK:
+                break
+            elif state == psycopg2.extensions.POLL_READ:
+                wait_read(conn.fileno(), timeout=timeout)
+            elif state == psycopg2.extensions.POLL_WRITE:
+                wait_write(conn.fileno(), timeout=timeout)
+            else:
+                raise psycopg2.OperationalError(f"Bad result from poll: {state}")
+
+    psycopg2.extensions.set_wait_callback(wait_callback)
+
+def create_db_pool_lock():
+    """Create the lock guarding pool creation; call once the worker has booted."""
+    global db_pool_lock
+    db_pool_lock = threading.Lock()
+
 def init_db_pool():
-    """Initialize the database connection pool."""
+    """Initialize the database connection pool; run once per server process."""
     global db_pool
-    if db_pool is None:
+    if db_pool_lock is None:
+        # Outside gunicorn, e.g. a script importing main directly
+        create_db_pool_lock()
+    with db_pool_lock:
+        if db_pool is not None:
+            return
         try:
             logger.debug("Initializing the database connection pool...")
-            # Ensure database and table exist
-            ensure_database_and_table()
+            # Normally done in the gunicorn master; retried here if the
+            # database was unreachable when the server started
+            if not schema_ready:
+                ensure_database_and_table()
 
-            # Initialize the connection pool
-            db_pool = psycopg2.pool.SimpleConnectionPool(
-                minconn=1,
-                maxconn=20,
+            # Threaded pool shared by the worker's threads; minconn keeps one
+            # warm connection per thread, capped so DB_POOL_SIZE stays the ceiling
+            maxconn = int(os.getenv('DB_POOL_SIZE', 16))
+            minconn = min(int(os.getenv('DB_POOL_MIN', os.getenv('GUNICORN_THREADS', 4))), maxconn)
+            db_pool = PreparedConnectionPool(
+                minconn=minconn,
+                maxconn=maxconn,
                 user=os.getenv('DB_USER', 'user'),
                 password=os.getenv('DB_PASSWORD', 'password'),
                 host=os.getenv('DB_HOST', 'localhost'),
                 port=os.getenv('DB_PORT', 5432),
-                database=os.getenv('DB_NAME', 'database')
+                database=os.getenv('DB_NAME', 'database'),
+                client_encoding='UTF8',
+                # Let the kernel notice half-closed sockets between pings
+                keepalives=1,
+                keepalives_idle=30
             )
             logger.debug("Database connection pool initialized successfully.")
         except Exception as e:
-            logger.error(f"Failed to initialize the database pool: {e}")
+            logger.error("Failed to initialize the database pool: %s", e)
             raise
 
 def get_db_connection():
     """Retrieve a connection from the connection pool."""
-    global db_pool
     if db_pool is None:
         init_db_pool()
     try:
         return db_pool.getconn()
     except Exception as e:
-        logger.error(f"Error getting connection from pool: {e}")
+        logger.error("Error getting connection from pool: %s", e)
         raise
 
 def release_db_connection(conn):
@@ -112,147 +322,418 @@ def release_db_connection(conn):
     global db_pool
     if db_pool and conn:
         try:
+            if not conn.closed and not conn.autocommit:
+                # End the explicit transaction a handler opened
+                conn.rollback()
+                conn.autocommit = True
             db_pool.putconn(conn)
         except Exception as e:
-            logger.error(f"Error releasing connection to pool: {e}")
+            logger.error("Error releasing connection to pool: %s", e)
+            db_pool.putconn(conn, close=True)
+
+def json_response(payload, status=200):
+    """Serialize a payload with orjson into a JSON response."""
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
+def static_json_response(payload, status):
+    """Pre-encode a constant payload into a (body, status, headers) tuple."""
+    return orjson.dumps(payload), status, {'Content-Type': 'application/json'}
+
+# Constant responses, encoded once at import
+RESPONSE_NO_RECIPES = static_json_response({"message": "No recipes found"}, 500)
+RESPONSE_CREATE_FAILED = static_json_response({
+    "message": "Recipe creation failed!",
+    "required": "title, making_time, serves, ingredients, cost"
+}, 200)
+RESPONSE_RECIPE_NOT_FOUND = static_json_response({"message": "Recipe not found"}, 404)
+RESPONSE_RETRIEVE_FAILED = static_json_response({"message": "Failed to retrieve recipe"}, 500)
+RESPONSE_UPDATED_NOTHING = static_json_response({
+    "message": "Recipe successfully updated",
+    "recipe": []
+}, 200)
+RESPONSE_NO_RECIPE_FOUND = static_json_response({"message": "No Recipe found"}, 404)
+RESPONSE_DELETED = static_json_response({"message": "Recipe successfully deleted"}, 200)
+RESPONSE_DELETE_FAILED = static_json_response({"message": "Failed to delete recipe"}, 500)
+RESPONSE_BULK_UPDATED_NOTHING = static_json_response({
+    "message": "Recipes successfully updated",
+    "recipes": []
+}, 200)
+RESPONSE_BULK_DUPLICATE_IDS = static_json_response({"message": "Each recipe id may appear only once"}, 400)
+
+def encode_cacheable(payload):
+    """Encode a payload once into the (body, etag) pair kept in the read caches."""
+    body = orjson.dumps(payload)
+    return body, generate_etag(body)
+
+def conditional_json_response(cached):
+    """Build a 200 JSON response from a (body, etag) pair, or a 304 if the client's copy matches."""
+    body, etag = cached
+    response = app.response_class(body, status=200, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+def invalidate_recipe_cache(*recipe_ids):
+    """Drop cached reads that a write to the given recipes may have made stale."""
+    global cache_generation
+    with cache_lock:
+        cache_generation += 1
+        for recipe_id in recipe_ids:
+            recipe_cache.pop(recipe_id, None)
+        page_cache.clear()
 
 @app.route('/recipes', methods=['GET'])
 def get_recipes():
-    """Retrieve all recipes."""
+    """Retrieve all recipes, streamed from a server-side cursor."""
+    if 'limit' in request.args or 'after' in request.args:
+        return get_recipes_page()
+
+    return stream_recipes(f"SELECT {RECIPE_COLUMNS} FROM recipes", RECIPE_FIELDS)
+
+@app.route('/recipes/summary', methods=['GET'])
+def get_recipes_summary():
+    """Retrieve every recipe without its ingredients, streamed like GET /recipes."""
+    return stream_recipes(f"SELECT {SUMMARY_COLUMNS} FROM recipes ORDER BY id", SUMMARY_FIELDS)
+
+def stream_recipes(query, fields):
+    """Run a query on a server-side cursor and stream its rows as {"recipes": [...]}."""
+    conn = None
+    try:
+        conn = get_db_connection()
+        # Server-side cursors only live inside a transaction
+        conn.autocommit = False
+        cursor = conn.cursor(name='recipes_stream')
+        cursor.execute(query)
+        # Fetch the first batch up front so query errors still get a 500
+        recipes = cursor.fetchmany(STREAM_BATCH_SIZE)
+    except Exception as e:
+        logger.error("Error retrieving recipes: %s", e)
+        release_db_connection(conn)
+        return RESPONSE_NO_RECIPES
+
+    def generate(recipes):
+        try:
+            yield b'{"recipes":['
+            separator = b''
+            while recipes:
+                yield separator + b','.join(orjson.dumps(dict(zip(fields, recipe))) for recipe in recipes)
+                separator = b','
+                recipes = cursor.fetchmany(STREAM_BATCH_SIZE)
+            yield b']}'
+            cursor.close()
+        except Exception as e:
+            logger.error("Error streaming recipes: %s", e)
+            raise
+
+    response = app.response_class(generate(recipes), status=200, mimetype='application/json')
+    # The connection is held until the server closes the response, which it
+    # does after the last row, on a client disconnect, and also for HEAD
+    # requests, where the body is never iterated at all
+    response.call_on_close(lambda: release_db_connection(conn))
+    return response
+
+def get_recipes_page():
+    """Retrieve one page of recipes ordered by id, starting after ?after=."""
+    limit = max(1, min(request.args.get('limit', DEFAULT_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+    # Ids are positive int4 values, so any cursor outside that range is
+    # the same page as the nearest bound and never reaches the integer cast
+    after = max(0, min(request.args.get('after', 0, type=int), MAX_RECIPE_ID))
+    with cache_lock:
+        page = page_cache.get((after, limit))
+        generation = cache_generation
+    if page is not None:
+        return conditional_json_response(page)
+
+    conn = None
     try:
         conn = get_db_connection()
-        cursor = conn.cursor(cursor_factory=DictCursor)
-        cursor.execute("SELECT * FROM recipes")
+        cursor = conn.cursor()
+        cursor.execute("EXECUTE select_recipes_page (%s, %s)", (after, limit))
         recipes = cursor.fetchall()
         cursor.close()
-        release_db_connection(conn)
-        return jsonify({"recipes": [dict(recipe) for recipe in recipes]}), 200
+
+        # A short page means there is nothing left to fetch
+        next_cursor = recipes[-1][0] if len(recipes) == limit else None
+        page = encode_cacheable({
+            "recipes": [dict(zip(RECIPE_FIELDS, recipe)) for recipe in recipes],
+            "next_cursor": next_cursor
+        })
+        with cache_lock:
+            if generation == cache_generation:
+                page_cache[(after, limit)] = page
+        return conditional_json_response(page)
     except Exception as e:
-        logger.error(f"Error retrieving recipes: {e}")
-        return jsonify({"message": "No recipes found"}), 500
+        logger.error("Error retrieving recipes page: %s", e)
+        return RESPONSE_NO_RECIPES
+    finally:
+        release_db_connection(conn)
 
 @app.route('/recipes', methods=['POST'])
 def create_recipe():
     """Create a new recipe."""
+    conn = None
     try:
-        data = request.get_json()
-        required_fields = ['title', 'making_time', 'serves', 'ingredients', 'cost']
-        
-        # Check if any required field is missing
-        if not all(field in data and data[field] for field in required_fields):
-            return jsonify({
-                "message": "Recipe creation failed!",
-                "required": "title, making_time, serves, ingredients, cost"
-            }), 200  # Return 200 but with failure message
+        try:
+            recipe = recipe_decoder.decode(request.get_data(cache=False))
+        except msgspec.DecodeError:
+            return RESPONSE_CREATE_FAILED  # Return 200 but with failure message
 
         conn = get_db_connection()
-        cursor = conn.cursor(cursor_factory=DictCursor)
+        cursor = conn.cursor()
         cursor.execute(
-            """
-            INSERT INTO recipes (title, making_time, serves, ingredients, cost)
-            VALUES (%s, %s, %s, %s, %s) 
-            RETURNING *
-            """,
-            (data['title'], data['making_time'], data['serves'], data['ingredients'], int(data['cost']))
+            "EXECUTE insert_recipe (%s, %s, %s, %s, %s)",
+            msgspec.structs.astuple(recipe)
         )
         new_recipe = cursor.fetchone()
-        conn.commit()
         cursor.close()
-        release_db_connection(conn)
+        invalidate_recipe_cache()
         
-        return jsonify({
+        return json_response({
             "message": "Recipe successfully created!",
-            "recipe": [dict(new_recipe)]
-        }), 200
+            "recipe": [dict(zip(RECIPE_FIELDS, new_recipe))]
+        }, 200)
     except Exception as e:
-        logger.error(f"Error creating recipe: {e}")
-        return jsonify({
-            "message": "Recipe creation failed!",
-            "required": "title, making_time, serves, ingredients, cost"
-        }), 200  # Return 200 even for errors
+        logger.error("Error creating recipe: %s", e)
+        return RESPONSE_CREATE_FAILED  # Return 200 even for errors
+    finally:
+        release_db_connection(conn)
+
+def copy_recipes(cursor, rows):
+    """Load rows through COPY into a staging table and insert them in one statement."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.execute("""
+        CREATE TEMP TABLE recipes_import (
+            title VARCHAR(100),
+            making_time VARCHAR(100),
+            serves VARCHAR(100),
+            ingredients VARCHAR(300),
+            cost INTEGER
+        ) ON COMMIT DROP
+    """)
+    cursor.copy_expert("COPY recipes_import FROM STDIN WITH (FORMAT csv)", buffer)
+    cursor.execute(f"""
+        INSERT INTO recipes (title, making_time, serves, ingredients, cost)
+        SELECT title, making_time, serves, ingredients, cost FROM recipes_import
+        RETURNING {RECIPE_COLUMNS}
+    """)
+    return cursor.fetchall()
+
+@app.route('/recipes/bulk', methods=['POST'])
+def create_recipes_bulk():
+    """Create many recipes in one transaction with multi-row INSERTs or COPY."""
+    conn = None
+    try:
+        try:
+            recipes = recipe_batch_decoder.decode(request.get_data(cache=False))
+        except msgspec.DecodeError:
+            return RESPONSE_CREATE_FAILED  # Return 200 but with failure message
+
+        conn = get_db_connection()
+        # All pages of the batch commit or roll back together
+        conn.autocommit = False
+        cursor = conn.cursor()
+        rows = [msgspec.structs.astuple(recipe) for recipe in recipes]
+        # COPY is unavailable while a gevent wait callback is installed
+        if len(rows) > BULK_COPY_THRESHOLD and psycopg2.extensions.get_wait_callback() is None:
+            new_recipes = copy_recipes(cursor, rows)
+        else:
+            new_recipes = execute_values(
+                cursor,
+                f"""
+                INSERT INTO recipes (title, making_time, serves, ingredients, cost)
+                VALUES %s
+                RETURNING {RECIPE_COLUMNS}
+                """,
+                rows,
+                page_size=BULK_PAGE_SIZE,
+                fetch=True
+            )
+        conn.commit()
+        cursor.close()
+        invalidate_recipe_cache()
+
+        return json_response({
+            "message": "Recipes successfully created!",
+            "recipes": [dict(zip(RECIPE_FIELDS, recipe)) for recipe in new_recipes]
+        }, 200)
+    except Exception as e:
+        logger.error("Error creating recipes in bulk: %s", e)
+        return RESPONSE_CREATE_FAILED  # Return 200 even for errors
+    finally:
+        release_db_connection(conn)
+
+@app.route('/recipes/bulk', methods=['PATCH'])
+def update_recipes_bulk():
+    """Update many recipes in one transaction with UPDATE ... FROM (VALUES ...)."""
+    conn = None
+    try:
+        patches = recipe_patch_batch_decoder.decode(request.get_data(cache=False))
+        # Repeated ids would be applied in an arbitrary order within a page
+        if len({patch.id for patch in patches}) != len(patches):
+            return RESPONSE_BULK_DUPLICATE_IDS
+
+        # Like PATCH /recipes/<id>, entries with nothing to change and ids
+        # that cannot exist are left alone rather than sent to the database;
+        # each row is the patched fields followed by the id
+        rows = [msgspec.structs.astuple(patch) for patch in patches]
+        rows = [
+            row for row in rows
+            if 0 < row[-1] <= MAX_RECIPE_ID and any(value is not None for value in row[:-1])
+        ]
+        if not rows:
+            return RESPONSE_BULK_UPDATED_NOTHING
+
+        conn = get_db_connection()
+        # All pages of the batch commit or roll back together
+        conn.autocommit = False
+        cursor = conn.cursor()
+        # Fields left out arrive as NULL and are kept by COALESCE; the casts
+        # give those NULLs a type inside the VALUES list
+        updated_recipes = execute_values(
+            cursor,
+            f"""
+            UPDATE recipes AS r SET
+                title = COALESCE(v.title, r.title),
+                making_time = COALESCE(v.making_time, r.making_time),
+                serves = COALESCE(v.serves, r.serves),
+                ingredients = COALESCE(v.ingredients, r.ingredients),
+                cost = COALESCE(v.cost, r.cost),
+                updated_at = CURRENT_TIMESTAMP
+            FROM (VALUES %s) AS v (title, making_time, serves, ingredients, cost, id)
+            WHERE r.id = v.id
+            RETURNING {", ".join(f"r.{field}" for field in RECIPE_FIELDS)}
+            """,
+            rows,
+            template="(%s::varchar, %s::varchar, %s::varchar, %s::varchar, %s::integer, %s::integer)",
+            page_size=BULK_UPDATE_PAGE_SIZE,
+            fetch=True
+        )
+        conn.commit()
+        cursor.close()
+        invalidate_recipe_cache(*(row[-1] for row in rows))
+
+        return json_response({
+            "message": "Recipes successfully updated",
+            "recipes": [dict(zip(RECIPE_FIELDS, recipe)) for recipe in updated_recipes]
+        }, 200)
+    except Exception as e:
+        logger.error("Error updating recipes in bulk: %s", e)
+        return RESPONSE_NO_RECIPE_FOUND
+    finally:
+        release_db_connection(conn)
 
 @app.route('/recipes/<int:recipe_id>', methods=['GET'])
 def get_recipe_by_id(recipe_id):
     """Retrieve a specific recipe by ID."""
+    if recipe_id > MAX_RECIPE_ID:
+        return RESPONSE_RECIPE_NOT_FOUND
+    with cache_lock:
+        cached = recipe_cache.get(recipe_id)
+        generation = cache_generation
+    if cached is not None:
+        return conditional_json_response(cached)
+
+    conn = None
     try:
         conn = get_db_connection()
-        cursor = conn.cursor(cursor_factory=DictCursor)
-        cursor.execute("SELECT * FROM recipes WHERE id = %s", (recipe_id,))
+        cursor = conn.cursor()
+        cursor.execute("EXECUTE select_recipe (%s)", (recipe_id,))
         recipe = cursor.fetchone()
         cursor.close()
-        release_db_connection(conn)
 
         if recipe:
-            return jsonify({"message": "Recipe details by id", "recipe": [dict(recipe)]}), 200
+            cached = encode_cacheable({
+                "message": "Recipe details by id",
+                "recipe": [dict(zip(RECIPE_FIELDS, recipe))]
+            })
+            with cache_lock:
+                if generation == cache_generation:
+                    recipe_cache[recipe_id] = cached
+            return conditional_json_response(cached)
         else:
-            return jsonify({"message": "Recipe not found"}), 404
+            return RESPONSE_RECIPE_NOT_FOUND
     except Exception as e:
-        logger.error(f"Error retrieving recipe by ID: {e}")
-        return jsonify({"message": "Failed to retrieve recipe"}), 500
+        logger.error("Error retrieving recipe by ID: %s", e)
+        return RESPONSE_RETRIEVE_FAILED
+    finally:
+        release_db_connection(conn)
 
 @app.route('/recipes/<int:recipe_id>', methods=['PATCH'])
 def update_recipe(recipe_id):
     """Update a specific recipe by ID."""
+    conn = None
     try:
-        data = request.get_json()
-        update_fields = ['title', 'making_time', 'serves', 'ingredients', 'cost']
-        updates = {key: data[key] for key in update_fields if key in data}
+        patch = recipe_patch_decoder.decode(request.get_data(cache=False))
+        updates = msgspec.structs.astuple(patch)
 
-        if not updates:
+        if all(value is None for value in updates):
             # Return successful response even if no fields to update
-            return jsonify({
-                "message": "Recipe successfully updated",
-                "recipe": []
-            }), 200
-
-        set_clause = ", ".join(f"{key} = %s" for key in updates.keys())
-        query = f"UPDATE recipes SET {set_clause} WHERE id = %s RETURNING *"
+            return RESPONSE_UPDATED_NOTHING
+        if recipe_id > MAX_RECIPE_ID:
+            # Return success even if recipe not found
+            return RESPONSE_UPDATED_NOTHING
 
+        # Fields left out are passed as NULL and kept by COALESCE
         conn = get_db_connection()
-        cursor = conn.cursor(cursor_factory=DictCursor)
-        cursor.execute(query, (*updates.values(), recipe_id))
+        cursor = conn.cursor()
+        cursor.execute(
+            "EXECUTE update_recipe (%s, %s, %s, %s, %s, %s)",
+            (*updates, recipe_id)
+        )
         updated_recipe = cursor.fetchone()
-        conn.commit()
         cursor.close()
-        release_db_connection(conn)
+        invalidate_recipe_cache(recipe_id)
 
         if updated_recipe:
-            return jsonify({
+            return json_response({
                 "message": "Recipe successfully updated",
-                "recipe": [dict(updated_recipe)]
-            }), 200
+                "recipe": [dict(zip(RECIPE_FIELDS, updated_recipe))]
+            }, 200)
         else:
             # Return success even if recipe not found
-            return jsonify({
-                "message": "Recipe successfully updated",
-                "recipe": []
-            }), 200
+            return RESPONSE_UPDATED_NOTHING
     except Exception as e:
-        logger.error(f"Error updating recipe by ID: {e}")
-        return jsonify({"message": "No Recipe found"}), 404
+        logger.error("Error updating recipe by ID: %s", e)
+        return RESPONSE_NO_RECIPE_FOUND
+    finally:
+        release_db_connection(conn)
 
 
 @app.route('/recipes/<int:recipe_id>', methods=['DELETE'])
 def delete_recipe(recipe_id):
     """Delete a specific recipe by ID."""
+    if recipe_id > MAX_RECIPE_ID:
+        return RESPONSE_RECIPE_NOT_FOUND
+    conn = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM recipes WHERE id = %s RETURNING id", (recipe_id,))
-        deleted_recipe = cursor.fetchone()
-        conn.commit()
+        cursor.execute("EXECUTE delete_recipe (%s)", (recipe_id,))
+        deleted = cursor.rowcount
         cursor.close()
-        release_db_connection(conn)
+        invalidate_recipe_cache(recipe_id)
 
-        if deleted_recipe:
-            return jsonify({"message": "Recipe successfully deleted"}), 200
+        if deleted:
+            return RESPONSE_DELETED
         else:
-            return jsonify({"message": "Recipe not found"}), 404
+            return RESPONSE_RECIPE_NOT_FOUND
     except Exception as e:
-        logger.error(f"Error deleting recipe by ID: {e}")
-        return jsonify({"message": "Failed to delete recipe"}), 500
+        logger.error("Error deleting recipe by ID: %s", e)
+        return RESPONSE_DELETE_FAILED
+    finally:
+        release_db_connection(conn)
+
+# Sort the routing rules now, in the gunicorn master, rather than on
+# the first request each worker serves
+app.url_map.update()
 
 if __name__ == '__main__':
+    # Local development only; deployments run under gunicorn (see gunicorn.conf.py)
+    if os.getenv('FLASK_ENV') != 'development':
+        raise SystemExit("Run under gunicorn (gunicorn -c gunicorn.conf.py main:app), "
+                         "or set FLASK_ENV=development for the dev server")
     logger.info("Starting Flask application...")
+    ensure_database_and_table()
     init_db_pool()
     app.run(host='0.0.0.0', port=int(os.getenv('PORT', 3000)))